@@ -0,0 +1,164 @@
+import datetime
+import json
+import platform
+import subprocess
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from benchmarks.scenarios import SCENARIOS, BenchConfig, run_scenario
+
+# Metrics where a larger value is an improvement; everything else is a cost.
+HIGHER_IS_BETTER = {"pages_per_sec"}
+# Workload sizes rather than measurements: any change means the runs did not
+# do the same work and their timings are not comparable.
+COUNT_METRICS = {"pages_stored", "requests", "docs", "queries"}
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _flatten(metrics: dict, prefix: str = "") -> dict[str, float]:
+    flat: dict[str, float] = {}
+    for key, value in metrics.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+@click.group()
+def cli():
+    """DarkWeb Search benchmark suite"""
+
+
+@cli.command()
+@click.option(
+    "--scenario",
+    "-s",
+    "scenarios",
+    multiple=True,
+    type=click.Choice(list(SCENARIOS)),
+    help="Scenario to run (repeatable, default: all)",
+)
+@click.option("--pages", "-n", default=1000, help="Synthetic corpus size")
+@click.option("--seed", default=42, help="Corpus and query seed")
+@click.option("--vocab-size", default=5000, help="Zipfian vocabulary size")
+@click.option("--latency-ms", default=50.0, help="Fake onion response latency")
+@click.option("--jitter-ms", default=0.0, help="Extra random latency per request")
+@click.option("--concurrency", "-c", default=20, help="Crawler concurrency")
+@click.option("--queries", "-q", default=200, help="Queries per search model")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write results as JSON to this file",
+)
+def run(
+    scenarios: tuple[str, ...],
+    pages: int,
+    seed: int,
+    vocab_size: int,
+    latency_ms: float,
+    jitter_ms: float,
+    concurrency: int,
+    queries: int,
+    output: Path | None,
+):
+    with tempfile.TemporaryDirectory(prefix="darkweb-bench-") as tmp:
+        config = BenchConfig(
+            workdir=Path(tmp),
+            pages=pages,
+            seed=seed,
+            vocab_size=vocab_size,
+            latency=latency_ms / 1000,
+            jitter=jitter_ms / 1000,
+            concurrency=concurrency,
+            queries=queries,
+        )
+        params = {k: v for k, v in asdict(config).items() if k != "workdir"}
+
+        results = {}
+        for name in scenarios or SCENARIOS:
+            click.echo(f"[*] Running scenario '{name}'...")
+            results[name] = run_scenario(name, config)
+            for metric, value in _flatten(results[name]).items():
+                click.echo(f"    {metric}: {value:.4g}")
+
+    report = {
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "results": results,
+    }
+    if output:
+        output.write_text(json.dumps(report, indent=2))
+        click.secho(f"[✓] Results written to {output}", fg="green")
+    else:
+        click.echo(json.dumps(report, indent=2))
+
+
+@cli.command()
+@click.argument("baseline", type=click.Path(exists=True, path_type=Path))
+@click.argument("current", type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--threshold", "-t", default=5.0, help="Change in percent reported as significant"
+)
+def compare(baseline: Path, current: Path, threshold: float):
+    """Show per-metric changes between two `run --output` files."""
+    old = json.loads(baseline.read_text())
+    new = json.loads(current.read_text())
+    if old["params"] != new["params"]:
+        click.secho("[!] Runs used different parameters:", fg="yellow")
+        for key in sorted(set(old["params"]) | set(new["params"])):
+            if old["params"].get(key) != new["params"].get(key):
+                click.echo(
+                    f"    {key}: {old['params'].get(key)} -> {new['params'].get(key)}"
+                )
+
+    for name in new["results"]:
+        if name not in old["results"]:
+            continue
+        click.echo(f"\n{name}")
+        before = _flatten(old["results"][name])
+        after = _flatten(new["results"][name])
+        for metric in after:
+            if metric not in before:
+                continue
+            if metric.split(".")[-1] in COUNT_METRICS:
+                line = (
+                    f"  {metric:<20} {before[metric]:>12.4g} -> {after[metric]:<12.4g}"
+                )
+                if before[metric] == after[metric]:
+                    click.echo(line)
+                else:
+                    click.secho(f"{line} (mismatch)", fg="yellow")
+                continue
+            if not before[metric]:
+                continue
+            change = (after[metric] - before[metric]) / before[metric] * 100
+            line = (
+                f"  {metric:<20} {before[metric]:>12.4g} -> {after[metric]:<12.4g}"
+                f" ({change:+.1f}%)"
+            )
+            if abs(change) < threshold:
+                click.echo(line)
+                continue
+            improved = (change > 0) == (metric.split(".")[-1] in HIGHER_IS_BETTER)
+            click.secho(line, fg="green" if improved else "red")
@@ -0,0 +1,140 @@
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from html import escape
+from itertools import accumulate
+
+ONION_ALPHABET = "abcdefghijklmnopqrstuvwxyz234567"
+
+# Seeded at the head of the Zipf distribution so the corpus reads like the
+# pages the crawler actually sees and the risk keywords get hits.
+DOMAIN_TERMS = [
+    "market", "forum", "onion", "bitcoin", "vendor", "escrow", "wallet",
+    "drug", "weapon", "scam", "hosting", "privacy", "anonymous", "login",
+    "shop", "guide", "leak", "service", "mirror", "directory",
+]  # fmt: skip
+
+_CONSONANTS = "bcdfghjklmnprstvz"
+_VOWELS = "aeiou"
+
+
+@dataclass
+class SyntheticPage:
+    url: str
+    title: str
+    text: str
+    links: list[str] = field(default_factory=list)
+
+    @property
+    def host(self) -> str:
+        return self.url.removeprefix("http://")
+
+    def html(self) -> str:
+        anchors = "\n".join(
+            f'<li><a href="{url}">{url.removeprefix("http://")}</a></li>'
+            for url in self.links
+        )
+        return (
+            f"<html><head><title>{escape(self.title)}</title></head><body>"
+            f"<h1>{escape(self.title)}</h1><p>{escape(self.text)}</p>"
+            f"<ul>{anchors}</ul></body></html>"
+        )
+
+
+@dataclass
+class SyntheticCorpus:
+    pages: list[SyntheticPage]
+    vocabulary: list[str]
+    cum_weights: list[float]
+    seed: int
+
+    @property
+    def seed_url(self) -> str:
+        return self.pages[0].url
+
+    @property
+    def depth(self) -> int:
+        """Number of BFS levels needed to reach every page from the seed."""
+        by_url = {p.url: p for p in self.pages}
+        levels = {self.seed_url: 0}
+        queue = deque([self.seed_url])
+        while queue:
+            url = queue.popleft()
+            for link in by_url[url].links:
+                if link not in levels:
+                    levels[link] = levels[url] + 1
+                    queue.append(link)
+        return max(levels.values()) + 1
+
+    def sample_queries(self, n: int, seed: int | None = None) -> list[str]:
+        """Draw 1-3 word queries with the corpus' own term frequencies."""
+        rng = random.Random(self.seed if seed is None else seed)
+        return [
+            " ".join(rng.choices(self.vocabulary, cum_weights=self.cum_weights, k=k))
+            for k in (rng.randint(1, 3) for _ in range(n))
+        ]
+
+
+def _pseudo_word(rng: random.Random) -> str:
+    return "".join(
+        rng.choice(_CONSONANTS) + rng.choice(_VOWELS) for _ in range(rng.randint(2, 4))
+    )
+
+
+def _onion_host(rng: random.Random) -> str:
+    return "".join(rng.choices(ONION_ALPHABET, k=56)) + ".onion"
+
+
+def generate_corpus(
+    n_pages: int = 1000,
+    seed: int = 42,
+    vocab_size: int = 5000,
+    zipf_s: float = 1.1,
+    mean_words: int = 300,
+    max_out_links: int = 8,
+) -> SyntheticCorpus:
+    """Build a deterministic synthetic onion web.
+
+    Words follow a Zipf(``zipf_s``) distribution over ``vocab_size`` terms and
+    page lengths are log-normal around ``mean_words``. Every page is linked
+    from an earlier one so the whole graph is reachable from the first page;
+    extra links use preferential attachment, giving a few heavily linked hubs.
+    """
+    rng = random.Random(seed)
+
+    vocabulary = list(DOMAIN_TERMS)
+    seen = set(vocabulary)
+    while len(vocabulary) < vocab_size:
+        word = _pseudo_word(rng)
+        if word not in seen:
+            seen.add(word)
+            vocabulary.append(word)
+    cum_weights = list(
+        accumulate(1 / rank**zipf_s for rank in range(1, vocab_size + 1))
+    )
+
+    urls = [f"http://{_onion_host(rng)}" for _ in range(n_pages)]
+    links: list[list[str]] = [[] for _ in range(n_pages)]
+    # Each page appears once per in-link (plus once for itself) so that
+    # rng.choice() picks targets proportionally to their popularity.
+    attachment: list[int] = []
+    for i in range(n_pages):
+        if i:
+            parent = rng.randrange(i)
+            links[parent].append(urls[i])
+            attachment.append(i)
+        attachment.append(i)
+        for _ in range(rng.randint(0, max_out_links)):
+            target = rng.choice(attachment)
+            if target != i and urls[target] not in links[i]:
+                links[i].append(urls[target])
+                attachment.append(target)
+
+    pages = []
+    for url, out_links in zip(urls, links):
+        length = max(20, int(rng.lognormvariate(0, 0.6) * mean_words))
+        words = rng.choices(vocabulary, cum_weights=cum_weights, k=length)
+        title = " ".join(words[:4]).title()
+        pages.append(SyntheticPage(url, title, " ".join(words), out_links))
+
+    return SyntheticCorpus(pages, vocabulary, cum_weights, seed)
@@ -0,0 +1,41 @@
+import asyncio
+import random
+
+import httpx
+
+from benchmarks.corpus import SyntheticCorpus
+
+
+class FakeOnionWeb:
+    """Serves a synthetic corpus through an in-process httpx transport.
+
+    Stands in for the Tor SOCKS proxy: every request sleeps ``latency``
+    seconds (plus up to ``jitter``) before answering, so crawl throughput is
+    bounded the same way a real circuit bounds it.
+    """
+
+    def __init__(
+        self,
+        corpus: SyntheticCorpus,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        seed: int = 0,
+    ):
+        self.pages = {page.host: page for page in corpus.pages}
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.requests = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        delay = self.latency + self.rng.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        page = self.pages.get(request.url.host)
+        if page is None:
+            return httpx.Response(404, text="Not Found")
+        return httpx.Response(200, html=page.html())
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
@@ -0,0 +1,166 @@
+import asyncio
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.corpus import SyntheticCorpus, generate_corpus
+from benchmarks.fake_onion import FakeOnionWeb
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MODELS = ("boolean", "tfidf", "bm25")
+
+
+@dataclass
+class BenchConfig:
+    workdir: Path
+    pages: int = 1000
+    seed: int = 42
+    vocab_size: int = 5000
+    latency: float = 0.05
+    jitter: float = 0.0
+    concurrency: int = 20
+    queries: int = 200
+
+    def corpus(self) -> SyntheticCorpus:
+        return generate_corpus(self.pages, seed=self.seed, vocab_size=self.vocab_size)
+
+
+def peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _load_corpus(corpus: SyntheticCorpus) -> None:
+    from src.darkweb_search.database.database import bulk_save_pages, get_session
+
+    session = get_session()
+    bulk_save_pages(
+        session,
+        [
+            {"url": p.url, "title": p.title, "content": p.text, "status_code": 200}
+            for p in corpus.pages
+        ],
+    )
+    session.commit()
+    session.close()
+
+
+def bench_crawl(config: BenchConfig) -> dict[str, Any]:
+    from src.darkweb_search.crawler.crawler import DarkWebCrawlerAsync
+    from src.darkweb_search.database.database import get_session
+    from src.darkweb_search.database.models import Page
+
+    corpus = config.corpus()
+    web = FakeOnionWeb(corpus, latency=config.latency, jitter=config.jitter)
+    crawler = DarkWebCrawlerAsync(
+        [corpus.seed_url],
+        max_depth=corpus.depth,
+        concurrency=config.concurrency,
+        transport=web.transport(),
+    )
+
+    start = time.perf_counter()
+    asyncio.run(crawler.crawl())
+    elapsed = time.perf_counter() - start
+
+    session = get_session()
+    stored = session.query(Page).count()
+    session.close()
+    return {
+        "pages_stored": stored,
+        "requests": web.requests,
+        "seconds": elapsed,
+        "pages_per_sec": stored / elapsed if elapsed else 0.0,
+    }
+
+
+def bench_index(config: BenchConfig) -> dict[str, Any]:
+    from src.darkweb_search.indexer.indexer import Indexer
+
+    _load_corpus(config.corpus())
+    indexer = Indexer(index_dir=config.workdir / "indices")
+    rss_before = peak_rss_mb()
+
+    start = time.perf_counter()
+    indexer.reindex_all()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "docs": config.pages,
+        "seconds": elapsed,
+        "rss_before_mb": rss_before,
+    }
+
+
+def bench_search(config: BenchConfig) -> dict[str, Any]:
+    from src.darkweb_search.indexer.indexer import Indexer
+
+    corpus = config.corpus()
+    _load_corpus(corpus)
+    indexer = Indexer(index_dir=config.workdir / "indices")
+    indexer.reindex_all()
+    queries = corpus.sample_queries(config.queries)
+    search = {
+        "boolean": indexer.search_boolean,
+        "tfidf": indexer.search_tfidf,
+        "bm25": indexer.search_bm25,
+    }
+
+    results: dict[str, Any] = {"queries": len(queries)}
+    for model in MODELS:
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            search[model](query)
+            latencies.append((time.perf_counter() - start) * 1000)
+        results[model] = {
+            "p50_ms": percentile(latencies, 50),
+            "p99_ms": percentile(latencies, 99),
+            "mean_ms": sum(latencies) / len(latencies),
+        }
+    return results
+
+
+SCENARIOS: dict[str, Callable[[BenchConfig], dict[str, Any]]] = {
+    "crawl": bench_crawl,
+    "index": bench_index,
+    "search": bench_search,
+}
+
+
+def _run_isolated(name: str, config: BenchConfig) -> dict[str, Any]:
+    # Runs in a fresh interpreter: the database module reads its path and
+    # creates the schema at import time, and peak RSS must not carry over
+    # from other scenarios.
+    scenario_dir = config.workdir / name
+    scenario_dir.mkdir(parents=True, exist_ok=True)
+    os.environ["DARKWEB_DB_PATH"] = str(scenario_dir / "bench.db")
+    config.workdir = scenario_dir
+    result = SCENARIOS[name](config)
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def run_scenario(name: str, config: BenchConfig) -> dict[str, Any]:
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(_run_isolated, name, config).result()
@@ -1,8 +1,9 @@
 import click
+import json
 import asyncio
+from pathlib import Path
 
 from src.darkweb_search.indexer.indexer import Indexer
-from src.darkweb_search.risk_assessor.risk_assessor import RiskAssessor
 
 
 PROXY = "socks5h://127.0.0.1:9050"
@@ -44,6 +45,38 @@ def crawl(query: str, max_depth: int, concurrency: int):
     click.secho("[✓] Crawling complete.", fg="green")
 
 
+@cli.command()
+@click.argument(
+    "paths", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path)
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Parser processes (default: CPUs)",
+)
+@click.option(
+    "--batch-size",
+    "-b",
+    default=1000,
+    type=click.IntRange(min=1),
+    help="Pages per bulk insert",
+)
+def ingest(paths: tuple[Path, ...], workers: int | None, batch_size: int):
+    """Load pages from WARC files or directories of saved HTML."""
+    click.echo(f"[*] Ingesting {len(paths)} path(s)...")
+    from src.darkweb_search.ingest.ingest import Ingestor
+
+    ingestor = Ingestor(workers=workers, batch_size=batch_size)
+    ingestor.ingest(paths)
+    click.secho(
+        f"[✓] Ingestion complete: {ingestor.pages_added} new pages, "
+        f"{ingestor.links_added} new links, {ingestor.skipped} skipped.",
+        fg="green",
+    )
+
+
 @cli.command()
 def index():
     click.echo("[*] Re-indexing documents...")
@@ -61,8 +94,24 @@ def index():
     default="tfidf",
     help="Search model: boolean, tfidf or bm25",
 )
-def search(query: str, model: str):
-    click.echo(f"[*] Searching '{query}' with model={model}")
+@click.option(
+    "--limit", "-l", default=5, type=click.IntRange(min=1), help="Results per page"
+)
+@click.option(
+    "--offset", "-o", default=0, type=click.IntRange(min=0), help="Results to skip"
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Output format: human-readable text or JSON",
+)
+def search(query: str, model: str, limit: int, offset: int, output_format: str):
+    as_json = output_format == "json"
+    if not as_json:
+        click.echo(f"[*] Searching '{query}' with model={model}")
     idx = Indexer()
 
     if model == "boolean":
@@ -72,25 +121,71 @@ def search(query: str, model: str):
         results = idx.search_tfidf(query)
     else:
         results = idx.search_bm25(query)
+    # tfidf/bm25 score every document; zero means none of the terms matched
+    results = [(doc_id, score) for doc_id, score in results if score != 0]
 
-    if not results:
-        click.secho("[!] No results found.", fg="yellow")
-        return
-
-    click.echo("[*] Top 5 results:")
-    from src.darkweb_search.database.database import get_session
-    from src.darkweb_search.database.models import Page
+    from src.darkweb_search.database.database import get_page_summaries, get_session
+    from src.darkweb_search.utils.text import highlight_spans, query_terms
 
+    page_results = results[offset : offset + limit]
+    terms = query_terms(query)
     session = get_session()
-    for doc_id, score in results[:5]:
-        page = session.query(Page).get(doc_id)
+    summaries = get_page_summaries(
+        session, [doc_id for doc_id, _ in page_results], terms
+    )
+    session.close()
+
+    hits = []
+    for rank, (doc_id, score) in enumerate(page_results, start=offset + 1):
+        page = summaries.get(doc_id)
         if not page:
             continue
-        line = f"• {page.title or 'No Title'} (URL: {page.url})"
-        if score is not None:
-            line += f" [Score: {score:.4f}]"
+        hits.append(
+            {
+                "rank": rank,
+                "id": doc_id,
+                "url": page["url"],
+                "title": page["title"],
+                "score": None if score is None else float(score),
+                "snippet": page["snippet"],
+                "highlights": highlight_spans(page["snippet"], terms),
+            }
+        )
+
+    if as_json:
+        payload = {
+            "query": query,
+            "model": model,
+            "total": len(results),
+            "offset": offset,
+            "limit": limit,
+            "results": hits,
+        }
+        click.echo(json.dumps(payload, ensure_ascii=False))
+        return
+
+    if not hits:
+        click.secho("[!] No results found.", fg="yellow")
+        return
+
+    click.echo(f"[*] Results {hits[0]['rank']}-{hits[-1]['rank']} of {len(results)}:")
+    for hit in hits:
+        line = f"• {hit['title'] or 'No Title'} (URL: {hit['url']})"
+        if hit["score"] is not None:
+            line += f" [Score: {hit['score']:.4f}]"
         click.echo(line)
-    session.close()
+        if hit["snippet"]:
+            click.echo(f"  {_highlight(hit['snippet'], hit['highlights'])}")
+
+
+def _highlight(text: str, spans: list[tuple[int, int]]) -> str:
+    parts, pos = [], 0
+    for start, end in spans:
+        parts.append(text[pos:start])
+        parts.append(click.style(text[start:end], fg="yellow", bold=True))
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
 
 
 @cli.command()
@@ -106,6 +201,7 @@ def assess(top: int, method: str):
     click.echo(f"[*] Assessing last {top} pages via method={method}")
     from src.darkweb_search.database.database import get_session
     from src.darkweb_search.database.models import Base
+    from src.darkweb_search.risk_assessor.risk_assessor import RiskAssessor
 
     session = get_session()
     pages = (
@@ -26,18 +26,19 @@ class DarkWebCrawlerAsync:
         max_depth: int = 2,
         concurrency: int = 5,
         proxy: str = PROXY,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         self.max_depth = max_depth
         self.concurrency = concurrency
         self.proxy = proxy
+        self.transport = transport
         self.visited: set[str] = set()
         self.current_level: set[str] = set(seeds)
 
     def extract_links(self, html: str) -> set[str]:
-        matches = ONION_REGEX.findall(html)
         urls: set[str] = set()
-        for grp in matches:
-            url = grp[0] + grp[1] if isinstance(grp, tuple) else grp
+        for match in ONION_REGEX.finditer(html):
+            url = match.group(0)
             url = url if url.startswith("http") else f"http://{url}"
             urls.add(url)
         return urls
@@ -82,7 +83,7 @@ class DarkWebCrawlerAsync:
                 progress.update(task_id, advance=1)
 
     async def crawl(self):
-        transport = httpx.AsyncHTTPTransport(proxy=self.proxy)
+        transport = self.transport or httpx.AsyncHTTPTransport(proxy=self.proxy)
         async with httpx.AsyncClient(
             transport=transport,
             headers=HEADERS,
@@ -1,12 +1,19 @@
 import datetime
+import os
 from pathlib import Path
 from src.darkweb_search.utils import logger
-from src.darkweb_search.database.models import Base, Page, Link
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy import create_engine
+from src.darkweb_search.database.models import Base, Page, Link, link_staging
+from sqlalchemy.orm import aliased, sessionmaker, Session
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy import create_engine, func, select
 
 
-DB_PATH = Path(__file__).parent.parent.parent.parent / "data" / "darkweb.db"
+DB_PATH = Path(
+    os.environ.get(
+        "DARKWEB_DB_PATH",
+        Path(__file__).parent.parent.parent.parent / "data" / "darkweb.db",
+    )
+)
 DB_URL = f"sqlite:///{DB_PATH}"
 
 
@@ -67,6 +74,48 @@ def save_link(session: Session, from_url: str, to_url: str):
     session.commit()
 
 
+def bulk_save_pages(session: Session, pages: list[dict]) -> int:
+    """Insert many pages in one statement, skipping URLs already stored.
+
+    Does not commit, so callers can group several batches in one transaction.
+    """
+    if not pages:
+        return 0
+    stmt = sqlite_insert(Page.__table__).on_conflict_do_nothing(index_elements=["url"])
+    result = session.execute(stmt, pages)
+    return max(result.rowcount, 0)
+
+
+def stage_links(session: Session, edges: set[tuple[str, str]]) -> None:
+    """Park (from_url, to_url) edges until ``resolve_staged_links`` runs."""
+    if edges:
+        session.execute(
+            link_staging.insert(),
+            [{"from_url": src, "to_url": dst} for src, dst in edges],
+        )
+
+
+def resolve_staged_links(session: Session) -> int:
+    """Turn staged edges into links between stored pages, then clear them.
+
+    Like ``save_link``, edges whose endpoints are not stored pages are
+    dropped, and links that already exist are not inserted again.
+    """
+    src, dst = aliased(Page), aliased(Page)
+    resolved = (
+        select(src.id, dst.id)
+        .select_from(link_staging)
+        .join(src, src.url == link_staging.c.from_url)
+        .join(dst, dst.url == link_staging.c.to_url)
+        .except_(select(Link.from_page_id, Link.to_page_id))
+    )
+    result = session.execute(
+        Link.__table__.insert().from_select(["from_page_id", "to_page_id"], resolved)
+    )
+    session.execute(link_staging.delete())
+    return max(result.rowcount, 0)
+
+
 def get_all_documents(session: Session) -> tuple[list[str], list[int]]:
     pages = session.query(Page).all()
     texts, ids = [], []
@@ -77,4 +126,45 @@ def get_all_documents(session: Session) -> tuple[list[str], list[int]]:
     return texts, ids
 
 
+def get_page_summaries(
+    session: Session,
+    ids: list[int],
+    terms: list[str] | None = None,
+    snippet_width: int = 160,
+) -> dict[int, dict]:
+    """Fetch url/title and a content snippet for ``ids`` in a single query.
+
+    The snippet is cut by SQLite around the first query term found in the
+    page, so the full ``content`` column is never loaded into Python.
+    """
+    if not ids:
+        return {}
+
+    content = func.coalesce(Page.content, "")
+    positions = [
+        func.nullif(func.instr(func.lower(content), term.lower()), 0)
+        for term in terms or []
+    ]
+    match_pos = func.coalesce(*positions, 1) if positions else 1
+    start = func.max(match_pos - snippet_width // 2, 1)
+    stmt = select(
+        Page.id,
+        Page.url,
+        Page.title,
+        func.substr(content, start, snippet_width).label("snippet"),
+        (start > 1).label("cut_head"),
+        (func.length(content) >= start + snippet_width).label("cut_tail"),
+    ).where(Page.id.in_(ids))
+
+    summaries: dict[int, dict] = {}
+    for row in session.execute(stmt):
+        snippet = (row.snippet or "").strip()
+        if snippet and row.cut_head:
+            snippet = "…" + snippet
+        if snippet and row.cut_tail:
+            snippet += "…"
+        summaries[row.id] = {"url": row.url, "title": row.title, "snippet": snippet}
+    return summaries
+
+
 init_db()
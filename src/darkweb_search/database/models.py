@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table
 from sqlalchemy.orm import declarative_base, relationship
 from datetime import datetime
 
@@ -34,3 +34,13 @@ class Link(Base):
         "Page", foreign_keys=[from_page_id], back_populates="links_from"
     )
     target = relationship("Page", foreign_keys=[to_page_id], back_populates="links_to")
+
+
+# Scratch space for bulk ingestion: (from_url, to_url) edges are parked here
+# until every page is stored, then resolved into ``links`` in one statement.
+link_staging = Table(
+    "link_staging",
+    Base.metadata,
+    Column("from_url", String, nullable=False),
+    Column("to_url", String, nullable=False),
+)
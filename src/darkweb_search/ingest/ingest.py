@@ -0,0 +1,174 @@
+import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import urlsplit
+
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+from src.darkweb_search.crawler.crawler import DarkWebCrawlerAsync
+from src.darkweb_search.database.database import (
+    bulk_save_pages,
+    get_session,
+    resolve_staged_links,
+    stage_links,
+)
+from src.darkweb_search.ingest.warc import WarcRecord, iter_warc
+from src.darkweb_search.utils import logger
+
+WARC_SUFFIXES = (".warc", ".warc.gz")
+HTML_SUFFIXES = (".html", ".htm")
+
+# Only the stateless parse/extract_links helpers are used, so one instance
+# per worker process is enough.
+_PARSER = DarkWebCrawlerAsync([])
+
+
+def normalize_url(url: str) -> str:
+    """Collapse a host's root page to the form ``extract_links`` produces.
+
+    ``http://<host>.onion/``, ``.../index.html`` and ``.../index.htm`` become
+    ``http://<host>.onion``; any other path, query or fragment is kept as is.
+    """
+    parts = urlsplit(url)
+    if (
+        parts.netloc
+        and parts.path.lower() in ("", "/", "/index.html", "/index.htm")
+        and not parts.query
+        and not parts.fragment
+    ):
+        return f"{parts.scheme}://{parts.netloc}"
+    return url
+
+
+def _html_url(path: Path) -> str:
+    path = path.resolve()
+    for parent in path.parents:
+        if parent.name.lower().endswith(".onion"):
+            return f"http://{parent.name}/{path.relative_to(parent).as_posix()}"
+    return path.as_uri()
+
+
+def _html_record(path: Path) -> WarcRecord:
+    visited_at = datetime.datetime.fromtimestamp(
+        path.stat().st_mtime, datetime.timezone.utc
+    )
+    return WarcRecord(
+        url=_html_url(path),
+        status_code=200,
+        html=path.read_text(encoding="utf-8", errors="replace"),
+        visited_at=visited_at,
+    )
+
+
+def iter_html_dir(root: Path) -> Iterator[WarcRecord]:
+    """Yield saved HTML pages under ``root``.
+
+    Files anywhere below a ``<host>.onion`` directory get an onion URL built
+    from that directory, anything else is addressed by its ``file://`` URI.
+    """
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.suffix.lower() in HTML_SUFFIXES:
+            yield _html_record(path)
+
+
+def iter_sources(paths: Iterable[Path]) -> Iterator[WarcRecord]:
+    for path in paths:
+        if path.is_dir():
+            for warc in sorted(path.rglob("*")):
+                if warc.is_file() and warc.name.lower().endswith(WARC_SUFFIXES):
+                    yield from iter_warc(warc)
+            yield from iter_html_dir(path)
+        elif path.name.lower().endswith(WARC_SUFFIXES):
+            yield from iter_warc(path)
+        elif path.suffix.lower() in HTML_SUFFIXES:
+            yield _html_record(path)
+        else:
+            logger.log(f"[!] Skipping unsupported input: {path}", level="error")
+
+
+def parse_record(record: WarcRecord) -> tuple[dict, set[str]]:
+    title, text = _PARSER.parse(record.html)
+    page = {
+        "url": normalize_url(record.url),
+        "title": title,
+        "content": text,
+        "status_code": record.status_code,
+        "visited_at": record.visited_at or datetime.datetime.now(datetime.timezone.utc),
+    }
+    return page, {normalize_url(link) for link in _PARSER.extract_links(record.html)}
+
+
+def _batches(records: Iterator[WarcRecord], size: int) -> Iterator[list[WarcRecord]]:
+    while batch := list(islice(records, size)):
+        yield batch
+
+
+class Ingestor:
+    def __init__(
+        self,
+        workers: int | None = None,
+        batch_size: int = 1000,
+        commit_every: int = 10,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.commit_every = commit_every
+        self.pages_added = 0
+        self.links_added = 0
+        self.skipped = 0
+
+    def ingest(self, paths: Iterable[Path]) -> None:
+        """Parse ``paths`` in a process pool and bulk-insert pages and links.
+
+        Pages are written ``batch_size`` at a time and committed every
+        ``commit_every`` batches. Each batch's links are staged in the
+        database rather than kept in memory, and resolved against the stored
+        pages in a single statement once every page is in.
+        """
+        records = (r for r in iter_sources(paths) if self._accept(r))
+        session = get_session()
+        try:
+            with (
+                ProcessPoolExecutor(max_workers=self.workers) as pool,
+                Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    TextColumn("{task.completed} docs"),
+                    TimeElapsedColumn(),
+                ) as progress,
+            ):
+                task_id = progress.add_task("Ingesting", total=None)
+                chunksize = max(1, self.batch_size // (self.workers * 4))
+                for n, batch in enumerate(_batches(records, self.batch_size), 1):
+                    pages, edges = [], set()
+                    for page, links in pool.map(
+                        parse_record, batch, chunksize=chunksize
+                    ):
+                        pages.append(page)
+                        edges.update((page["url"], link) for link in links)
+                    self.pages_added += bulk_save_pages(session, pages)
+                    stage_links(session, edges)
+                    if n % self.commit_every == 0:
+                        session.commit()
+                    progress.update(task_id, advance=len(batch))
+
+            self.links_added = resolve_staged_links(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        logger.log(
+            f"[✓] Ingested {self.pages_added} pages, {self.links_added} links "
+            f"({self.skipped} records skipped)"
+        )
+
+    def _accept(self, record: WarcRecord) -> bool:
+        if record.status_code == 200:
+            return True
+        self.skipped += 1
+        return False
@@ -0,0 +1,161 @@
+import datetime
+import gzip
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from src.darkweb_search.utils import logger
+
+
+@dataclass
+class WarcRecord:
+    url: str
+    status_code: int
+    html: str
+    visited_at: datetime.datetime | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _open(path: Path) -> BinaryIO:
+    # gzip.open transparently reads the per-record members of .warc.gz files
+    if path.suffix.lower() == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _read_headers(stream: BinaryIO) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    while True:
+        line = stream.readline()
+        if not line or line in (b"\r\n", b"\n"):
+            return headers
+        name, _, value = line.decode("utf-8", errors="replace").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+def _parse_date(value: str | None) -> datetime.datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _dechunk(body: bytes) -> bytes:
+    out, pos = bytearray(), 0
+    while pos < len(body):
+        end = body.find(b"\r\n", pos)
+        if end < 0:
+            break
+        try:
+            size = int(body[pos:end].split(b";")[0], 16)
+        except ValueError:
+            return body
+        if size == 0:
+            break
+        out += body[end + 2 : end + 2 + size]
+        pos = end + 2 + size + 2
+    return bytes(out)
+
+
+def _decode_body(body: bytes, headers: dict[str, str]) -> str:
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        body = _dechunk(body)
+    encoding = headers.get("content-encoding", "").lower()
+    try:
+        if encoding in ("gzip", "x-gzip"):
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+    except zlib.error:
+        pass
+
+    charset = "utf-8"
+    for param in headers.get("content-type", "").split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "charset" and value:
+            charset = value.strip("\"'")
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _parse_http(payload: bytes) -> tuple[int, dict[str, str], bytes] | None:
+    head, sep, body = payload.partition(b"\r\n\r\n")
+    if not sep:
+        head, sep, body = payload.partition(b"\n\n")
+    lines = head.decode("iso-8859-1").splitlines()
+    if not lines or not lines[0].startswith("HTTP/"):
+        return None
+    parts = lines[0].split()
+    try:
+        status_code = int(parts[1])
+    except (IndexError, ValueError):
+        return None
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status_code, headers, body
+
+
+def _iter_records(stream: BinaryIO, path: Path) -> Iterator[WarcRecord]:
+    while True:
+        line = stream.readline()
+        if not line:
+            return
+        if not line.startswith(b"WARC/"):
+            continue
+        warc_headers = _read_headers(stream)
+        try:
+            length = int(warc_headers.get("content-length", 0))
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            # The record boundary is unknown; resync on the next WARC/ line
+            logger.log(f"[!] Bad Content-Length in {path}, skipping record", "error")
+            continue
+        payload = stream.read(length)
+
+        rtype = warc_headers.get("warc-type")
+        url = warc_headers.get("warc-target-uri", "").strip("<>")
+        if rtype not in ("response", "resource") or not url:
+            continue
+
+        if rtype == "response":
+            parsed = _parse_http(payload)
+            if parsed is None:
+                logger.log(f"[!] Unparsable HTTP response for {url} in {path}", "error")
+                continue
+            status_code, headers, body = parsed
+        else:
+            status_code, body = 200, payload
+            headers = {"content-type": warc_headers.get("content-type", "")}
+
+        content_type = headers.get("content-type", "").lower()
+        if content_type and "html" not in content_type:
+            continue
+
+        yield WarcRecord(
+            url=url,
+            status_code=status_code,
+            html=_decode_body(body, headers),
+            visited_at=_parse_date(warc_headers.get("warc-date")),
+            headers=headers,
+        )
+
+
+def iter_warc(path: Path) -> Iterator[WarcRecord]:
+    """Stream HTML responses out of a (optionally gzipped) WARC file.
+
+    Malformed records are logged and skipped; a corrupt or truncated file
+    stops at the last readable record instead of aborting the ingest.
+    """
+    try:
+        with _open(path) as stream:
+            yield from _iter_records(stream, path)
+    except (OSError, EOFError, zlib.error) as e:
+        logger.log(f"[!] Stopped reading {path}: {e}", "error")
@@ -1,3 +1,4 @@
+import re
 import string
 
 import nltk
@@ -39,3 +40,19 @@ def preprocess_text(
         tokens = [_LEMMATIZER.lemmatize(tok) for tok in tokens]
 
     return tokens
+
+
+def query_terms(query: str) -> list[str]:
+    """Surface forms and lemmas of the query words, used to locate matches."""
+    raw = preprocess_text(query, lemmatize=False)
+    lemmas = [_LEMMATIZER.lemmatize(tok) for tok in raw]
+    return list(dict.fromkeys(raw + lemmas))
+
+
+def highlight_spans(text: str, terms: list[str]) -> list[tuple[int, int]]:
+    """Return sorted, non-overlapping (start, end) spans of ``terms`` in ``text``."""
+    if not text or not terms:
+        return []
+    alternatives = sorted({re.escape(t) for t in terms if t}, key=len, reverse=True)
+    pattern = re.compile("|".join(alternatives), re.IGNORECASE)
+    return [m.span() for m in pattern.finditer(text)]
@@ -0,0 +1,22 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# The database module creates its schema on import; keep that away from the
+# real data/darkweb.db.
+os.environ.setdefault(
+    "DARKWEB_DB_PATH", str(Path(tempfile.mkdtemp(prefix="darkweb-tests-")) / "db")
+)
+
+from src.darkweb_search.database import database  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    path = tmp_path / "darkweb.db"
+    monkeypatch.setattr(database, "DB_PATH", path)
+    monkeypatch.setattr(database, "DB_URL", f"sqlite:///{path}")
+    database.init_db()
+    return database
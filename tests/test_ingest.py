@@ -0,0 +1,118 @@
+from warc_helpers import http_response, warc_record, write_warc
+
+from src.darkweb_search.database.models import Link, Page
+from src.darkweb_search.ingest.ingest import Ingestor, _html_url, normalize_url
+
+A = "a" * 16 + ".onion"
+B = "b" * 16 + ".onion"
+C = "c" * 16 + ".onion"
+
+
+def _page(title: str, *links: str) -> bytes:
+    anchors = "".join(f'<a href="http://{host}/">{host}</a>' for host in links)
+    return f"<html><title>{title}</title><body>{anchors}</body></html>".encode()
+
+
+def _stored(db) -> tuple[dict[int, str], set[tuple[str, str]]]:
+    session = db.get_session()
+    urls = {p.id: p.url for p in session.query(Page)}
+    links = {(urls[lk.from_page_id], urls[lk.to_page_id]) for lk in session.query(Link)}
+    session.close()
+    return urls, links
+
+
+def test_normalize_url():
+    assert normalize_url(f"http://{A}/") == f"http://{A}"
+    assert normalize_url(f"http://{A}/index.html") == f"http://{A}"
+    assert normalize_url(f"http://{A}/INDEX.HTM") == f"http://{A}"
+    assert normalize_url(f"http://{A}") == f"http://{A}"
+
+
+def test_normalize_url_keeps_paths_and_queries():
+    for url in (
+        f"http://{A}/forum/about.html",
+        f"http://{A}/forum/",
+        f"http://{A}/view?file=report.html",
+        f"http://{A}/?page=2",
+        f"http://{A}/index.html#top",
+        "file:///srv/archive/a.html",
+    ):
+        assert normalize_url(url) == url
+
+
+def test_html_url_uses_nearest_onion_directory(tmp_path):
+    page = tmp_path / "archive" / "saved" / A / "forum" / "index.html"
+    page.parent.mkdir(parents=True)
+    page.touch()
+    assert _html_url(page) == f"http://{A}/forum/index.html"
+    assert _html_url(tmp_path / "x.html").startswith("file://")
+
+
+def test_ingest_resolves_links_across_batches(db, tmp_path):
+    warc = write_warc(
+        tmp_path / "crawl.warc.gz",
+        [
+            warc_record(f"http://{C}/", http_response(_page("C", A, B))),
+            warc_record(f"http://{B}/gone", http_response(b"", status="404 Not Found")),
+            warc_record(f"http://{A}/", http_response(_page("A", C))),
+        ],
+    )
+    saved = tmp_path / "archive" / "saved" / B / "index.html"
+    saved.parent.mkdir(parents=True)
+    saved.write_bytes(_page("B", A))
+
+    ingestor = Ingestor(workers=1, batch_size=1, commit_every=1)
+    ingestor.ingest([warc, tmp_path / "archive"])
+
+    urls, links = _stored(db)
+    assert sorted(urls.values()) == [f"http://{A}", f"http://{B}", f"http://{C}"]
+    assert links == {
+        (f"http://{C}", f"http://{A}"),
+        (f"http://{C}", f"http://{B}"),
+        (f"http://{A}", f"http://{C}"),
+        (f"http://{B}", f"http://{A}"),
+    }
+    assert (ingestor.pages_added, ingestor.links_added, ingestor.skipped) == (3, 4, 1)
+
+
+def test_reingest_adds_nothing(db, tmp_path):
+    warc = write_warc(
+        tmp_path / "crawl.warc",
+        [
+            warc_record(f"http://{A}/", http_response(_page("A", B))),
+            warc_record(f"http://{B}/", http_response(_page("B", A))),
+        ],
+    )
+    Ingestor(workers=1).ingest([warc])
+    again = Ingestor(workers=1)
+    again.ingest([warc])
+
+    assert (again.pages_added, again.links_added) == (0, 0)
+    assert len(_stored(db)[1]) == 2
+
+
+def test_dangling_links_dropped_and_deep_paths_kept(db, tmp_path):
+    missing = "d" * 16 + ".onion"
+    warc = write_warc(
+        tmp_path / "crawl.warc",
+        [
+            warc_record(
+                f"http://{A}/forum/thread.html?id=7",
+                http_response(_page("T", B, missing)),
+            ),
+            warc_record(f"http://{B}/", http_response(_page("B", A))),
+        ],
+    )
+    ingestor = Ingestor(workers=1, batch_size=1, commit_every=1)
+    ingestor.ingest([warc])
+
+    urls, links = _stored(db)
+    assert sorted(urls.values()) == [
+        f"http://{A}/forum/thread.html?id=7",
+        f"http://{B}",
+    ]
+    # B links to the bare A root, which was never stored
+    assert links == {(f"http://{A}/forum/thread.html?id=7", f"http://{B}")}
+    session = db.get_session()
+    assert session.execute(db.link_staging.select()).all() == []
+    session.close()
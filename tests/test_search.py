@@ -0,0 +1,136 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from src.darkweb_search import cli as cli_module
+from src.darkweb_search.database.models import Page
+from src.darkweb_search.utils.text import highlight_spans
+
+LONG = "x " * 200 + "needle in the haystack" + " y" * 200
+
+
+def _add_pages(db, *pages: Page) -> list[int]:
+    session = db.get_session()
+    session.add_all(pages)
+    session.commit()
+    ids = [p.id for p in pages]
+    session.close()
+    return ids
+
+
+def _summaries(db, ids, terms, width=40):
+    session = db.get_session()
+    try:
+        return db.get_page_summaries(session, ids, terms, snippet_width=width)
+    finally:
+        session.close()
+
+
+def test_snippet_window_around_first_match(db):
+    (doc_id,) = _add_pages(db, Page(url="http://a.onion", title="A", content=LONG))
+    snippet = _summaries(db, [doc_id], ["needle"])[doc_id]["snippet"]
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "needle" in snippet
+    assert len(snippet) <= 42
+
+
+def test_snippet_falls_back_to_start_without_match(db):
+    (doc_id,) = _add_pages(db, Page(url="http://a.onion", title="A", content=LONG))
+    snippet = _summaries(db, [doc_id], ["absent"])[doc_id]["snippet"]
+    assert snippet.startswith("x x") and snippet.endswith("…")
+
+
+def test_snippet_of_short_and_null_content(db):
+    short, empty = _add_pages(
+        db,
+        Page(url="http://a.onion", title="A", content="Buy a NEEDLE"),
+        Page(url="http://b.onion", title=None, content=None),
+    )
+    summaries = _summaries(db, [short, empty, 999], ["needle"])
+    assert summaries[short] == {
+        "url": "http://a.onion",
+        "title": "A",
+        "snippet": "Buy a NEEDLE",
+    }
+    assert summaries[empty]["snippet"] == ""
+    assert 999 not in summaries
+    assert _summaries(db, [], ["needle"]) == {}
+
+
+def test_highlight_spans():
+    text = "Buy ONION domains, onion shop"
+    assert highlight_spans(text, ["onion", "buy"]) == [(0, 3), (4, 9), (19, 24)]
+    assert highlight_spans(text, ["domain", "domains"]) == [(10, 17)]
+    assert highlight_spans(text, []) == []
+    assert highlight_spans("", ["onion"]) == []
+
+
+class FakeIndexer:
+    def search_tfidf(self, query):
+        if query == "zzzz":
+            return [(doc_id, 0.0) for doc_id in FakeIndexer.ids]
+        scores = [0.9, 0.5, 0.0]
+        return list(zip(FakeIndexer.ids, scores))
+
+    search_bm25 = search_tfidf
+
+    def search_boolean(self, query):
+        return FakeIndexer.ids[:2]
+
+
+@pytest.fixture
+def run_search(db, monkeypatch):
+    FakeIndexer.ids = _add_pages(
+        db,
+        Page(url="http://a.onion", title="First", content="a needle here"),
+        Page(url="http://b.onion", title="Second", content="another needle"),
+        Page(url="http://c.onion", title="Third", content="nothing relevant"),
+    )
+    monkeypatch.setattr(cli_module, "Indexer", FakeIndexer)
+
+    def run(*args):
+        result = CliRunner().invoke(cli_module.cli, ["search", "-q", "needle", *args])
+        assert result.exit_code == 0, result.output
+        return result.output
+
+    return run
+
+
+def test_search_json_drops_zero_scores(run_search):
+    payload = json.loads(run_search("-f", "json"))
+    assert payload["total"] == 2
+    assert (payload["offset"], payload["limit"]) == (0, 5)
+    first = payload["results"][0]
+    assert first["rank"] == 1 and first["url"] == "http://a.onion"
+    assert first["title"] == "First" and first["score"] == pytest.approx(0.9)
+    assert first["snippet"] == "a needle here"
+    assert first["highlights"] == [[2, 8]]
+    assert [r["rank"] for r in payload["results"]] == [1, 2]
+
+
+def test_search_json_paging(run_search):
+    payload = json.loads(run_search("-f", "json", "--limit", "1", "--offset", "1"))
+    assert [r["url"] for r in payload["results"]] == ["http://b.onion"]
+    assert payload["results"][0]["rank"] == 2
+
+    payload = json.loads(run_search("-f", "json", "--offset", "5"))
+    assert payload["total"] == 2 and payload["results"] == []
+
+
+def test_search_boolean_has_no_score(run_search):
+    payload = json.loads(run_search("-f", "json", "-m", "boolean"))
+    assert [r["score"] for r in payload["results"]] == [None, None]
+
+
+def test_search_text_short_last_page(run_search):
+    output = run_search("--limit", "2", "--offset", "1")
+    assert "[*] Results 2-2 of 2:" in output
+    assert "• Second (URL: http://b.onion) [Score: 0.5000]" in output
+    assert "First" not in output
+
+
+def test_search_text_no_results(run_search):
+    assert "[!] No results found." in run_search("--offset", "2")
+    result = CliRunner().invoke(cli_module.cli, ["search", "-q", "zzzz"])
+    assert "[!] No results found." in result.output
@@ -0,0 +1,71 @@
+import gzip
+
+from warc_helpers import http_response, warc_record, write_warc
+
+from src.darkweb_search.ingest.warc import iter_warc
+
+HTML = b"<html><title>Market</title><body>hello</body></html>"
+
+
+def test_reads_plain_and_gzipped_warc(tmp_path):
+    records = [warc_record("http://aaaaaaaaaaaaaaaa.onion/", http_response(HTML))]
+    for name in ("crawl.warc", "crawl.warc.gz", "CRAWL.WARC.GZ"):
+        (record,) = iter_warc(write_warc(tmp_path / name, records))
+        assert record.url == "http://aaaaaaaaaaaaaaaa.onion/"
+        assert record.status_code == 200
+        assert record.html == HTML.decode()
+        assert record.visited_at.year == 2024
+
+
+def test_decodes_chunked_body(tmp_path):
+    chunked = b"10\r\n" + HTML[:16] + b"\r\n" + b"%x\r\n" % (len(HTML) - 16)
+    chunked += HTML[16:] + b"\r\n0\r\n\r\n"
+    payload = http_response(chunked, extra_headers="Transfer-Encoding: chunked\r\n")
+    path = write_warc(tmp_path / "c.warc", [warc_record("http://a.onion", payload)])
+    assert [r.html for r in iter_warc(path)] == [HTML.decode()]
+
+
+def test_decodes_gzip_body_and_charset(tmp_path):
+    body = gzip.compress("<title>Café</title>".encode("latin-1"))
+    payload = http_response(
+        body,
+        content_type="text/html; charset=latin-1",
+        extra_headers="Content-Encoding: gzip\r\n",
+    )
+    path = write_warc(tmp_path / "g.warc", [warc_record("http://a.onion", payload)])
+    assert [r.html for r in iter_warc(path)] == ["<title>Café</title>"]
+
+
+def test_skips_non_html_and_non_response_records(tmp_path):
+    path = write_warc(
+        tmp_path / "mixed.warc",
+        [
+            warc_record("http://a.onion/", b"GET / HTTP/1.1\r\n\r\n", "request"),
+            warc_record(
+                "http://a.onion/logo.png",
+                http_response(b"\x89PNG", content_type="image/png"),
+            ),
+            warc_record("http://b.onion/", http_response(HTML)),
+        ],
+    )
+    assert [r.url for r in iter_warc(path)] == ["http://b.onion/"]
+
+
+def test_non_200_records_keep_their_status(tmp_path):
+    payload = http_response(HTML, status="404 Not Found")
+    path = write_warc(tmp_path / "nf.warc", [warc_record("http://a.onion", payload)])
+    assert [r.status_code for r in iter_warc(path)] == [404]
+
+
+def test_bad_content_length_is_skipped(tmp_path):
+    good = warc_record("http://b.onion/", http_response(HTML))
+    bad = good.replace(b"Content-Length: ", b"Content-Length: x", 1)
+    path = write_warc(tmp_path / "bad.warc", [bad, good])
+    assert [r.url for r in iter_warc(path)] == ["http://b.onion/"]
+
+
+def test_truncated_gzip_stops_without_raising(tmp_path):
+    records = [warc_record("http://b.onion/", http_response(HTML))] * 2
+    path = write_warc(tmp_path / "t.warc.gz", records)
+    path.write_bytes(path.read_bytes()[:-20])
+    assert len(list(iter_warc(path))) <= 1
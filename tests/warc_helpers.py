@@ -0,0 +1,34 @@
+import gzip
+from pathlib import Path
+
+
+def http_response(
+    body: bytes,
+    status: str = "200 OK",
+    content_type: str = "text/html; charset=utf-8",
+    extra_headers: str = "",
+) -> bytes:
+    head = f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n{extra_headers}"
+    return head.encode() + b"\r\n" + body
+
+
+def warc_record(
+    url: str,
+    payload: bytes,
+    warc_type: str = "response",
+    date: str = "2024-01-02T03:04:05Z",
+) -> bytes:
+    head = (
+        f"WARC/1.0\r\nWARC-Type: {warc_type}\r\nWARC-Target-URI: {url}\r\n"
+        f"WARC-Date: {date}\r\nContent-Length: {len(payload)}\r\n\r\n"
+    )
+    return head.encode() + payload + b"\r\n\r\n"
+
+
+def write_warc(path: Path, records: list[bytes]) -> Path:
+    if path.name.lower().endswith(".gz"):
+        # One gzip member per record, as WARC writers do
+        path.write_bytes(b"".join(gzip.compress(r) for r in records))
+    else:
+        path.write_bytes(b"".join(records))
+    return path